@@ -29,9 +29,12 @@ logger = logging.getLogger(__name__)
 # Upload helpers
 # -------------------------
 
+UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]")
+
+
 def sanitize_filename(filename: str) -> str:
     """Return a safe filename for storage (remove path + dangerous chars)."""
-    safe = re.sub(r"[^a-zA-Z0-9._-]", "_", filename)
+    safe = UNSAFE_FILENAME_CHARS_RE.sub("_", filename)
     safe = os.path.basename(safe)
     if not safe.lower().endswith(".pdf"):
         safe += ".pdf"
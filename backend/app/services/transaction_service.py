@@ -22,7 +22,7 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
@@ -31,7 +31,7 @@ from sqlalchemy import and_, case, func
 
 from app.models.transaction import Transaction  # aligns with your Transaction model 
 from app.schemas.transactions import MovementType
-from app.utils.date_helpers import parse_bbva_date, validate_transaction_date
+from app.utils.date_helpers import make_bbva_date_parser, parse_bbva_date, validate_transaction_date
 from app.utils.hash_helpers import compute_transaction_hash
 
 
@@ -81,6 +81,7 @@ def create_transaction_from_parser_dict(
     statement_id: UUID,
     statement_month: date,
     db: Session,
+    date_parser: Optional[Callable[[str], date]] = None,
 ) -> Optional[Transaction]:
     """
     Create ONE Transaction from parser output.
@@ -92,6 +93,7 @@ def create_transaction_from_parser_dict(
     Notes:
     - Uses SAVEPOINT + flush (no commit). Caller should commit once after batch insert.
     - Enforces movement_type must already be classified (not None).
+    - date_parser: optional make_bbva_date_parser(statement_month) result, reused across a batch.
     """
     # Basic required fields from parser
     required = ["date", "description", "amount_abs"]
@@ -100,7 +102,10 @@ def create_transaction_from_parser_dict(
         raise ValueError(f"Missing required parser fields: {missing}")
 
     # 1) Parse & validate transaction_date
-    transaction_date = parse_bbva_date(parser_dict["date"], statement_month)
+    if date_parser is not None:
+        transaction_date = date_parser(parser_dict["date"])
+    else:
+        transaction_date = parse_bbva_date(parser_dict["date"], statement_month)
     if not validate_transaction_date(transaction_date, statement_month):
         raise ValueError(
             f"Transaction date {transaction_date} is outside valid range for statement month {statement_month}"
@@ -200,6 +205,9 @@ def create_transactions_from_parser_output(
     # Track occurrence count for identical transactions (same content, different occurrences)
     seen_content: Dict[str, int] = {}
 
+    # Same statement_month for every row: build the date parser once
+    date_parser = make_bbva_date_parser(statement_month)
+
     for d in parser_transactions:
         # Create content key (without occurrence index)
         content_key = f"{d.get('date')}:{d.get('description')}:{d.get('amount_abs')}"
@@ -218,6 +226,7 @@ def create_transactions_from_parser_output(
             statement_id=statement_id,
             statement_month=statement_month,
             db=db,
+            date_parser=date_parser,
         )
         if tx is None:
             duplicates += 1
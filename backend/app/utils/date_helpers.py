@@ -1,5 +1,6 @@
 """Date parsing utilities for BBVA statements."""
 from datetime import date
+from typing import Callable
 
 # Map Spanish month abbreviations to month numbers
 MONTH_MAP = {
@@ -44,37 +45,59 @@ def parse_bbva_date(date_str: str, statement_month: date) -> date:
     Raises:
         ValueError: If date_str format is invalid or month abbreviation unknown
     """
-    # Early validation
-    if not date_str or '/' not in date_str:
-        raise ValueError(f"Invalid date format: {date_str}")
+    return make_bbva_date_parser(statement_month)(date_str)
 
-    try:
-        # Normalize input (handle spaces and case)
-        date_str = date_str.strip()
-        day_str, month_abbr = [x.strip() for x in date_str.split('/', 1)]
-        month_abbr = month_abbr.upper()
 
-        # Parse day
-        day = int(day_str)
+def make_bbva_date_parser(statement_month: date) -> Callable[[str], date]:
+    """
+    Build a parse_bbva_date equivalent specialized for one statement month.
+
+    A statement is imported with a single statement_month, so the year and
+    month are read once here and captured as closure locals instead of being
+    looked up on every transaction.
+
+    Args:
+        statement_month: The statement period date (e.g., date(2025, 11, 1))
+
+    Returns:
+        Function taking a 'DD/MMM' string and returning the full date
+
+    Examples:
+        >>> parse = make_bbva_date_parser(date(2025, 1, 1))
+        >>> parse('28/DIC')
+        date(2024, 12, 28)
+    """
+    stmt_year = statement_month.year
+    stmt_month = statement_month.month
+
+    def parse(date_str: str) -> date:
+        # Early validation
+        if not date_str or '/' not in date_str:
+            raise ValueError(f"Invalid date format: {date_str}")
+
+        try:
+            # Normalize input (handle spaces and case)
+            date_str = date_str.strip()
+            day_str, month_abbr = [x.strip() for x in date_str.split('/', 1)]
+            month_abbr = month_abbr.upper()
 
-        # Get month number from abbreviation
-        month = MONTH_MAP.get(month_abbr)
-        if not month:
-            raise ValueError(f"Unknown month abbreviation: {month_abbr}")
+            # Parse day
+            day = int(day_str)
 
-        # Start with statement year
-        year = statement_month.year
+            # Get month number from abbreviation
+            month = MONTH_MAP.get(month_abbr)
+            if not month:
+                raise ValueError(f"Unknown month abbreviation: {month_abbr}")
 
-        # Handle year rollover
-        # Example: Statement is January 2025, transaction is "28/DIC" (December)
-        # This transaction happened in December 2024 (previous year)
-        if month > statement_month.month:
-            year -= 1
+            # Handle year rollover
+            # Example: Statement is January 2025, transaction is "28/DIC" (December)
+            # This transaction happened in December 2024 (previous year)
+            return date(stmt_year - (month > stmt_month), month, day)
 
-        return date(year, month, day)
+        except Exception as e:
+            raise ValueError(f"Invalid date format '{date_str}': {e}")
 
-    except Exception as e:
-        raise ValueError(f"Invalid date format '{date_str}': {e}")
+    return parse
 
 
 def validate_transaction_date(transaction_date: date, statement_month: date) -> bool:
@@ -1,11 +1,73 @@
+import gc
+import hashlib
+import io
+import json
+import logging
+import os
 import pdfplumber
 import re
-from typing import Dict, List, Optional, TypedDict, Callable, Tuple
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice, repeat
+from pdfminer.pdftypes import PDFStream, resolve1
+from pdfminer.psparser import LIT
+from typing import Dict, Iterable, Iterator, List, Optional, TypedDict, Callable, Tuple, Union
+
+logger = logging.getLogger(__name__)
 
 # Compile patterns once (performance + clarity)
-DATE_RE = re.compile(r'^\d{2}/[A-Z]{3}$')
-AMOUNT_RE = re.compile(r'^\d{1,3}(?:,\d{3})*\.\d{2}$')
-MONEY_RE = re.compile(r'(\d{1,3}(?:,\d{3})*\.\d{2})')
+# Dates and amounts are ASCII digits: re.ASCII skips Unicode digit lookups
+DATE_RE = re.compile(r'^\d{2}/[A-Z]{3}$', re.ASCII)
+AMOUNT_RE = re.compile(r'^\d{1,3}(?:,\d{3})*\.\d{2}$', re.ASCII)
+MONEY_RE = re.compile(r'(\d{1,3}(?:,\d{3})*\.\d{2})', re.ASCII)
+MONEY_LOOSE_RE = re.compile(r'[\d,]+\.\d{2}', re.ASCII)  # Also accepts ungrouped amounts like 47856.22
+INTEGER_RE = re.compile(r'\b(\d+)\b')
+
+# Section/header markers (case-insensitive search avoids a .lower() copy per line)
+SECTION_START_RE = re.compile(r'detalle de movimientos', re.IGNORECASE)
+SECTION_END_RE = re.compile(r'total de movimientos', re.IGNORECASE)
+# Every keyword that disqualifies a candidate/detail line, matched in one pass
+# (column headers "Fecha"/"Oper." plus both section markers)
+LINE_KEYWORDS_RE = re.compile(r'fecha|oper|detalle de movimientos|total de movimientos', re.IGNORECASE)
+
+# Summary ("Comportamiento") markers; precedence between them is applied by the caller
+SUMMARY_MARKER_RE = re.compile(
+    r'(?P<start>comportamiento)'
+    r'|(?P<end>saldo promedio mínimo mensual)'
+    r'|(?P<starting_balance>saldo anterior)'
+    r'|(?P<deposits>depósitos / abonos)'
+    r'|(?P<charges>retiros / cargos)'
+    r'|(?P<final_balance>saldo final)',
+    re.IGNORECASE
+)
+
+# Header words that rule a line out as the account holder's name (substring match)
+HOLDER_EXCLUDE_RE = re.compile(r'BBVA|CUENTA|PERIODO|SALDO|PAGINA')
+
+# Descriptions and detail lines up to this length are interned (short labels repeat a lot)
+INTERN_DESCRIPTION_MAX_LEN = 64
+
+# Full transaction line: two leading dates (DD/MMM DD/MMM) up to end of line.
+# [^\S\n] keeps the date separator from spanning lines when scanning a whole page.
+TX_LINE_RE = re.compile(r'^\d{2}/[A-Z]{3}[^\S\n]+\d{2}/[A-Z]{3}[^\n]*', re.MULTILINE)
+
+# Fast path for the common well-formed row: single-space separated, two dates,
+# description, then 1 or 3 amounts. The lazy description leaves the longest
+# run of trailing amounts to the amount groups. Digits are spelled [0-9] to
+# agree with DATE_RE/AMOUNT_RE, while \S stays Unicode-aware like str.split().
+TX_PARSE_RE = re.compile(
+    r'([0-9]{2}/[A-Z]{3}) ([0-9]{2}/[A-Z]{3}) (\S+(?: \S+)*?)'
+    r' ([0-9]{1,3}(?:,[0-9]{3})*\.[0-9]{2})(?: ([0-9]{1,3}(?:,[0-9]{3})*\.[0-9]{2}) ([0-9]{1,3}(?:,[0-9]{3})*\.[0-9]{2}))?'
+)
+
+def _parse_amount(token: str) -> Optional[float]:
+    """Validate and convert a BBVA amount token (e.g. '1,234.56') in one step; None if not an amount."""
+    if not AMOUNT_RE.fullmatch(token):
+        return None
+    # Amounts below 1,000 have no separator: skip the replace() copy for them
+    return float(token.replace(',', '') if ',' in token else token)
+
 
 def _extract_last_money(line: str) -> Optional[float]:
     """Return the LAST money amount like 1,234.56 found in the line."""
@@ -30,28 +92,266 @@ def _extract_count_and_last_money(line: str) -> tuple[Optional[int], Optional[fl
 
     # Find the position of the money amount in the line
     # Match patterns like "47,856.22" or "47856.22"
-    money_pattern = r'[\d,]+\.\d{2}'
     money_match = None
-    for match in re.finditer(money_pattern, line):
+    for match in MONEY_LOOSE_RE.finditer(line):
         money_match = match  # Keep updating to get the last match
 
     if not money_match:
         return None, amount
 
-    # Get the substring before the money amount
-    text_before_money = line[:money_match.start()]
-
-    # Find all integers in the text before the money amount
-    integers = [int(match.group(0)) for match in re.finditer(r'\b(\d+)\b', text_before_money)]
+    # Find the integers in the text before the money amount (endpos instead of
+    # slicing a copy); only the LAST one is converted
+    last_integer = None
+    for match in INTEGER_RE.finditer(line, 0, money_match.start()):
+        last_integer = match
 
-    if not integers:
+    if last_integer is None:
         return None, amount
 
     # The count is the LAST integer before the money amount
-    count = integers[-1]
+    count = int(last_integer.group(0))
 
     return count, amount
 
+# Text extraction backends for extract_transaction_lines
+# pdfplumber: layout-aware (default); pypdfium: faster text-only extraction via pypdfium2;
+# pdfminer: pdfminer.six text converter streamed page by page (no pdfplumber object model)
+PDF_BACKENDS = ("pdfplumber", "pypdfium", "pdfminer")
+
+# pdfminer objects form reference cycles; collect periodically on long statements
+PDF_GC_EVERY_PAGES = 50
+
+# Opt-in multi-process pdfplumber extraction: set the env var to the worker count.
+# Pages are split into contiguous ranges and the line scanner still runs sequentially.
+PDF_EXTRACT_WORKERS_ENV = "SALDO_PDF_EXTRACT_WORKERS"
+PDF_PARALLEL_MIN_PAGES = 20
+
+# XObject subtype that carries its own resources (and so possibly fonts)
+LITERAL_FORM = LIT("Form")
+
+
+def _page_may_have_text(page) -> bool:
+    """
+    Cheap check on the page resource dictionary (no content stream parsing).
+
+    Text needs a font, either in the page resources or inside a form XObject.
+    Image XObjects live under /XObject too, so a page that only places images
+    (a scanned page) is rejected by resolving each entry's /Subtype.
+    """
+    resources = page.page_obj.resources or {}
+    if "Font" in resources:
+        return True
+    xobjects = resolve1(resources.get("XObject"))
+    if not isinstance(xobjects, dict):
+        return False
+    for xobject in xobjects.values():
+        xobject = resolve1(xobject)
+        # Only form XObjects can draw text; unresolvable entries are kept to be safe
+        if not isinstance(xobject, PDFStream) or xobject.get("Subtype") is LITERAL_FORM:
+            return True
+    return False
+
+
+def _plumber_page_text(page) -> Optional[str]:
+    """Extract one pdfplumber page's text, or None when the page cannot hold text."""
+    # Quick reject: without fonts (directly or via form XObjects) a page
+    # cannot contain text, so skip the expensive layout analysis
+    if not _page_may_have_text(page):
+        return None
+    text = page.extract_text()
+    # Drop the page's cached char/layout objects before moving on;
+    # otherwise they live until the whole document is closed
+    page.flush_cache()
+    return text
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[Optional[str]]:
+    """Worker: open the PDF and extract pages [start, stop) (module level so it can be pickled)."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [_plumber_page_text(pdf.pages[i]) for i in range(start, stop)]
+
+
+def _parallel_page_texts(pdf_path: str, page_count: int, workers: int) -> Iterator[Optional[str]]:
+    """Extract contiguous page ranges in worker processes, yielding texts in page order."""
+    chunk = -(-page_count // workers)  # ceil division: one range per worker
+    starts = range(0, page_count, chunk)
+    stops = [min(start + chunk, page_count) for start in starts]
+
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        for texts in executor.map(_extract_page_range, repeat(pdf_path), starts, stops):
+            yield from texts
+
+
+def _extract_workers() -> int:
+    """Worker processes for pdfplumber extraction (env opt-in; 1 means sequential)."""
+    try:
+        return max(1, int(os.environ.get(PDF_EXTRACT_WORKERS_ENV, "1")))
+    except ValueError:
+        return 1
+
+
+def _iter_page_texts(pdf_path: str, backend: str = "pdfplumber") -> Iterator[Optional[str]]:
+    """Yield the extracted text of each page using the selected backend."""
+    if backend == "pdfplumber":
+        workers = _extract_workers()
+        with pdfplumber.open(pdf_path) as pdf:
+            # Process start-up and per-worker re-opening only pay off on long
+            # statements; below the threshold this handle does the extraction
+            page_count = len(pdf.pages)
+            parallel = workers > 1 and page_count >= PDF_PARALLEL_MIN_PAGES
+            if not parallel:
+                for page_number, page in enumerate(pdf.pages, 1):
+                    yield _plumber_page_text(page)
+                    if page_number % PDF_GC_EVERY_PAGES == 0:
+                        gc.collect()
+
+        if parallel:
+            # Workers open their own handles; the parent's is already closed
+            yield from _parallel_page_texts(pdf_path, page_count, workers)
+        else:
+            gc.collect()
+
+    elif backend == "pypdfium":
+        import pypdfium2 as pdfium  # Optional backend (requirements-optional.txt), imported only when requested
+
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                try:
+                    text = textpage.get_text_bounded()
+                finally:
+                    # Release native buffers explicitly (page by page)
+                    textpage.close()
+                    page.close()
+                # pdfium uses CRLF line endings; normalize to match pdfplumber output
+                yield text.replace("\r\n", "\n")
+        finally:
+            pdf.close()
+
+    elif backend == "pdfminer":
+        # pdfminer.six ships with pdfplumber; the text converter writes straight
+        # into a buffer without building per-character objects for every page
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+
+        buffer = io.StringIO()
+        resource_manager = PDFResourceManager()
+        device = TextConverter(resource_manager, buffer, laparams=LAParams())
+        try:
+            interpreter = PDFPageInterpreter(resource_manager, device)
+            with open(pdf_path, "rb") as fp:
+                for page in PDFPage.get_pages(fp):
+                    interpreter.process_page(page)
+                    text = buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate(0)
+                    # The converter ends every page with a form feed
+                    yield text.rstrip("\f")
+        finally:
+            device.close()
+
+    else:
+        raise ValueError(
+            f"Unknown PDF backend: {backend}. "
+            f"Supported: {', '.join(PDF_BACKENDS)}"
+        )
+
+
+# Opt-in on-disk cache of extracted page texts, for development loops and batch
+# re-parsing. Disabled unless the env var points to a directory: cached text
+# contains statement PII, and production deletes statement PDFs after processing.
+PDF_TEXT_CACHE_ENV = "SALDO_PDF_TEXT_CACHE_DIR"
+
+
+def _text_cache_file(pdf_path: str, backend: str) -> Optional[str]:
+    """
+    Return the cache file for this PDF's content and backend, or None if disabled.
+
+    Keyed by a blake2b hash of the file bytes (not path/mtime), so re-uploading
+    the same statement under a new temporary path still hits the cache.
+    """
+    cache_dir = os.environ.get(PDF_TEXT_CACHE_ENV)
+    if not cache_dir:
+        return None
+
+    digest = hashlib.blake2b(backend.encode("utf-8"), digest_size=16)
+    with open(pdf_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return os.path.join(os.path.expanduser(cache_dir), f"{digest.hexdigest()}.json")
+
+
+def _cached_page_texts(pdf_path: str, backend: str = "pdfplumber") -> Iterable[Optional[str]]:
+    """
+    Page texts for a PDF, served from the on-disk cache when enabled.
+
+    Without the cache this is just the lazy _iter_page_texts stream.
+    Cache writes are best-effort: failures never break parsing.
+    """
+    cache_file = _text_cache_file(pdf_path, backend)
+    if cache_file is None:
+        return _iter_page_texts(pdf_path, backend)
+
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if isinstance(cached, list) and all(text is None or isinstance(text, str) for text in cached):
+            return cached
+    except (OSError, ValueError):
+        pass  # Cache miss or unreadable entry
+    # Miss, unreadable or malformed entry: extract and rewrite below
+
+    page_texts = list(_iter_page_texts(pdf_path, backend))
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(page_texts, f)
+    except OSError:
+        pass
+
+    return page_texts
+
+
+# Per-page text of one PDF (None for pages without text); shared by all extractors
+PdfPageTexts = Tuple[Optional[str], ...]
+PdfSource = Union[str, "os.PathLike[str]", PdfPageTexts]
+
+
+@lru_cache(maxsize=4)
+def _extract_all_pages(pdf_path: str, mtime_ns: int, backend: str = "pdfplumber") -> PdfPageTexts:
+    """Extract every page once; mtime_ns is part of the cache key so edited files re-extract."""
+    return tuple(_cached_page_texts(pdf_path, backend))
+
+
+def _load_pdf_text(pdf_path: "Union[str, os.PathLike[str]]", backend: str = "pdfplumber") -> PdfPageTexts:
+    """Return the page texts of a PDF, opening it only once per file version."""
+    # fspath: "x.pdf" and Path("x.pdf") share one cache entry
+    pdf_path = os.fspath(pdf_path)
+    return _extract_all_pages(pdf_path, os.stat(pdf_path).st_mtime_ns, backend)
+
+
+def _is_pdf_path(pdf_path: PdfSource) -> bool:
+    """True for a filesystem path (str or PathLike), False for pre-loaded page texts."""
+    return isinstance(pdf_path, (str, os.PathLike))
+
+
+def _page_texts_for(pdf_path: PdfSource, backend: str = "pdfplumber") -> PdfPageTexts:
+    """Accept either a PDF path (legacy callers) or page texts that were already loaded."""
+    if _is_pdf_path(pdf_path):
+        return _load_pdf_text(pdf_path, backend)
+    return pdf_path
+
+
+# Every field the "Comportamiento" section reports (counts included)
+SUMMARY_KEYS = frozenset({
+    "starting_balance", "deposits_amount", "charges_amount",
+    "final_balance", "n_deposits", "n_charges",
+})
+
+
 # Type definitions for transaction structure
 class TransactionDict(TypedDict, total=False):
     """Type definition for a parsed transaction dictionary."""
@@ -84,7 +384,7 @@ class ParserResult(TypedDict):
     summary: Optional[SummaryDict]
 
 
-def extract_transaction_lines(pdf_path: str) -> List[Dict[str, Optional[str]]]:
+def extract_transaction_lines(pdf_path: PdfSource, backend: str = "pdfplumber") -> List[Dict[str, Optional[str]]]:
     """
     Extract raw transaction lines from a BBVA bank statement PDF.
 
@@ -97,84 +397,107 @@ def extract_transaction_lines(pdf_path: str) -> List[Dict[str, Optional[str]]]:
     and descriptions is intentionally handled in later processing steps.
 
     Args:
-        pdf_path: Path to the BBVA PDF statement.
+        pdf_path: Path to the BBVA PDF statement, or page texts from _load_pdf_text.
+        backend: Text extraction backend ("pdfplumber", "pypdfium" or "pdfminer").
+            pypdfium and pdfminer are faster and lighter on memory; pdfplumber
+            remains the default for its layout-aware text ordering. pypdfium
+            needs pypdfium2 (backend/requirements-optional.txt).
 
     Returns:
         List of dicts with 'main_line' and optional 'detail_line' for context.
     """
-    transaction_lines = []
-    inside_transactions = False
-    pattern = r'^\d{2}/[A-Z]{3}\s+\d{2}/[A-Z]{3}'
+    return list(_scan_transaction_lines(_page_texts_for(pdf_path, backend)))
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
 
-            if not text:
-                continue
+def iter_transaction_lines(pdf_path: str, backend: str = "pdfplumber") -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Lazily yield raw transaction lines from a BBVA PDF (see extract_transaction_lines).
 
-            lines = text.split('\n')
-            i = 0
+    Pages are extracted and filtered on demand, so consumers never hold the
+    full list of lines in memory (unless the opt-in text cache is enabled).
+    """
+    # Stage 1: text extraction (PDF backend). Stage 2: line filtering (pure Python).
+    return _scan_transaction_lines(_cached_page_texts(pdf_path, backend))
 
-            while i < len(lines):
-                line_clean = lines[i].rstrip()
-                line_lower = line_clean.lower()
 
-                # Start of transactions
-                if "detalle de movimientos" in line_lower:
-                    inside_transactions = True
-                    i += 1
-                    continue
+def _next_line_start(text: str, index: int) -> int:
+    """Return the index where the line after the one containing `index` starts."""
+    newline = text.find('\n', index)
+    return len(text) if newline == -1 else newline + 1
 
-                # End of transactions
-                if inside_transactions and "total de movimientos" in line_lower:
-                    inside_transactions = False
-                    i += 1
-                    continue
 
-                # Skip if not in transaction section
-                if not inside_transactions:
-                    i += 1
-                    continue
+def _scan_transaction_lines(page_texts: Iterable[Optional[str]]) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Filter transaction lines out of already-extracted page texts (in page order).
 
-                # Skip detail lines (start with space)
-                if line_clean.startswith(" "):
-                    i += 1
-                    continue
+    The "Detalle de Movimientos" section can span pages, so the
+    inside_transactions state is carried from one page to the next and
+    pages must be fed sequentially.
+
+    Instead of walking every line in Python, each page is cut into section
+    ranges with the marker regexes and TX_LINE_RE.finditer() sweeps each
+    range in one pass. Only the candidate lines it yields are inspected.
+    """
+    inside_transactions = False
+
+    for text in page_texts:
+        if not text:
+            continue
 
-                # Skip header lines
-                if "fecha" in line_lower or "oper" in line_lower:
-                    i += 1
+        text_len = len(text)
+        pos = 0  # Always the start of a line
+
+        while pos < text_len:
+            # Outside the section: jump to the next start marker (its line is skipped)
+            if not inside_transactions:
+                start_match = SECTION_START_RE.search(text, pos)
+                if start_match is None:
+                    break
+                inside_transactions = True
+                pos = _next_line_start(text, start_match.end())
+                continue
+
+            # Inside the section: it runs until the line holding the end marker
+            end_match = SECTION_END_RE.search(text, pos)
+            if end_match is None:
+                section_end = text_len
+                next_pos = text_len
+            else:
+                section_end = text.rfind('\n', 0, end_match.start()) + 1
+                next_pos = _next_line_start(text, end_match.end())
+
+            for match in TX_LINE_RE.finditer(text, pos, section_end):
+                line_clean = match.group().rstrip()
+
+                # Skip header lines and repeated section titles
+                # (candidates never hold the end marker: the range stops before it)
+                if LINE_KEYWORDS_RE.search(line_clean):
                     continue
 
-                # Real transaction (must match date pattern)
-                if re.match(pattern, line_clean):
-                    # Capture optional detail line (immediate next non-empty line that's not a transaction)
-                    detail_line = None
-                    if i + 1 < len(lines):
-                        next_line = lines[i + 1].rstrip()
-                        next_line_lower = next_line.lower()
-
-                        # Check if next line is a valid detail line:
-                        # - Not empty
-                        # - Not another transaction (doesn't start with date pattern)
-                        # - Not a header/section marker
-                        if (next_line and
-                            not re.match(pattern, next_line) and
-                            "fecha" not in next_line_lower and
-                            "oper" not in next_line_lower and
-                            "detalle de movimientos" not in next_line_lower and
-                            "total de movimientos" not in next_line_lower):
-                            detail_line = next_line.strip()
-
-                    transaction_lines.append({
-                        'main_line': line_clean,
-                        'detail_line': detail_line
-                    })
+                # Capture optional detail line (immediate next line on the same page)
+                detail_line = None
+                line_end = match.end()
+                if line_end < text_len:
+                    next_line = text[line_end + 1:_next_line_start(text, line_end + 1)].rstrip()
+
+                    # Check if next line is a valid detail line:
+                    # - Not empty
+                    # - Not another transaction (doesn't start with date pattern)
+                    # - Not a header/section marker
+                    if (next_line and
+                        not TX_LINE_RE.match(next_line) and
+                        not LINE_KEYWORDS_RE.search(next_line)):
+                        detail_line = next_line.strip()
 
-                i += 1
+                yield {
+                    'main_line': line_clean,
+                    'detail_line': detail_line
+                }
 
-    return transaction_lines
+            # A line with both markers counts as a section start (start is checked first)
+            if end_match is not None and not SECTION_START_RE.search(text, section_end, next_pos):
+                inside_transactions = False
+            pos = next_pos
 
 
 def parse_transaction_line(line: str, detail_line: Optional[str] = None, debug: bool = False) -> Optional[TransactionDict]:
@@ -189,60 +512,94 @@ def parse_transaction_line(line: str, detail_line: Optional[str] = None, debug:
     Args:
         line: Raw transaction line
         detail_line: Optional detail line for disambiguation context
-        debug: If True, print debug information during parsing
+        debug: If True, emit parse trace via logger.debug (visible when DEBUG logging is enabled)
 
     Returns:
         Parsed transaction or None if invalid
     """
 
+    # One C-level match covers most rows. If the description would end in
+    # an amount the row has 2 or 4+ amounts: leave it to the general path.
+    match = TX_PARSE_RE.fullmatch(line)
+    if match is not None and AMOUNT_RE.fullmatch(match.group(3).rpartition(' ')[2]):
+        match = None
+
     if debug:
-        print(f"\nParsing: {line}")
+        logger.debug("Parsing: %s", line)
         if detail_line:
-            print(f"Detail: {detail_line}")
+            logger.debug("Detail: %s", detail_line)
+
+    if match is not None:
+        fecha_operacion, fecha_liquidacion, description, amount, saldo_op, saldo_liq = match.groups()
+        result = _build_transaction(
+            fecha_operacion,
+            fecha_liquidacion,
+            description,
+            detail_line,
+            _parse_amount(amount),
+            _parse_amount(saldo_op) if saldo_op is not None else None,
+            _parse_amount(saldo_liq) if saldo_liq is not None else None,
+        )
+        if debug:
+            logger.debug("Parsed successfully: %s", result)
+        return result
 
-    # Split by spaces
-    tokens = line.strip().split()
+    # Two narrow splits instead of tokenizing the whole line:
+    # leading dates from the left, up to 3 trailing amounts from the right
+    parts = line.split(None, 2)
+    pieces = parts[2].rsplit(None, 3) if len(parts) == 3 else []
     if debug:
-        print(f"Tokens: {tokens}")
+        logger.debug("Tokens: %s", parts[:2] + pieces)
 
     # Validate minimum length: date date description amount
-    if len(tokens) < 4:
+    if len(pieces) < 2:
         if debug:
-            print("Not enough tokens")
+            logger.debug("Not enough tokens")
         return None
 
     # Validate first two tokens are dates
-    if not (DATE_RE.fullmatch(tokens[0]) and DATE_RE.fullmatch(tokens[1])):
+    if not (DATE_RE.fullmatch(parts[0]) and DATE_RE.fullmatch(parts[1])):
         if debug:
-            print("First two tokens are not dates")
+            logger.debug("First two tokens are not dates")
         return None
     
     # Extract dates
-    fecha_operacion = tokens[0]
-    fecha_liquidacion = tokens[1]
+    fecha_operacion = parts[0]
+    fecha_liquidacion = parts[1]
     
     # Parse from the END to extract amounts (they're always last)
-    rest_tokens = tokens[2:]
     amounts = []
+    description_end_index = len(pieces)
     
-    for token in reversed(rest_tokens):
-        if AMOUNT_RE.fullmatch(token):
-            # Convert to float (remove commas)
-            clean_amount = token.replace(',', '')
-            amounts.insert(0, float(clean_amount))
+    for index in range(len(pieces) - 1, -1, -1):
+        token = pieces[index]
+        if index == 0 and len(pieces) == 4:
+            # Unsplit head: only its last word could be a 4th amount (invalid row)
+            if AMOUNT_RE.fullmatch(token.rsplit(None, 1)[-1]):
+                if debug:
+                    logger.debug("Unexpected amount count: >3")
+                return None
+            break
+        amount = _parse_amount(token)
+        if amount is not None:
+            # Collected right-to-left, reversed once below
+            amounts.append(amount)
+            description_end_index = index
         else:
             # Stop when we hit non-amount (beginning of description)
             break
+    amounts.reverse()
     
-    # Description is everything between dates and amounts
-    description_end_index = len(rest_tokens) - len(amounts)
-    description_parts = rest_tokens[:description_end_index]
-    description = " ".join(description_parts)
+    # Description is everything between dates and amounts: one contiguous
+    # slice, re-joined only if it holds anything other than single spaces
+    description = " ".join(pieces[:description_end_index])
+    if "  " in description or not description.isprintable():
+        description = " ".join(description.split())
     
     # Validate we found amounts
     if len(amounts) == 0:
         if debug:
-            print("No amounts found")
+            logger.debug("No amounts found")
         return None
 
     # Structure based on amount count
@@ -259,10 +616,47 @@ def parse_transaction_line(line: str, detail_line: Optional[str] = None, debug:
     else:
         # Unexpected - likely parsing error
         if debug:
-            print(f"Unexpected amount count: {len(amounts)}")
+            logger.debug("Unexpected amount count: %d", len(amounts))
         return None
 
-    result: TransactionDict = {
+    result = _build_transaction(
+        fecha_operacion,
+        fecha_liquidacion,
+        description,
+        detail_line,
+        amount_abs,
+        saldo_operacion,
+        saldo_liquidacion,
+    )
+
+    if debug:
+        logger.debug("Parsed successfully: %s", result)
+    return result
+
+
+def _build_transaction(
+    fecha_operacion: str,
+    fecha_liquidacion: str,
+    description: str,
+    detail_line: Optional[str],
+    amount_abs: float,
+    saldo_operacion: Optional[float],
+    saldo_liquidacion: Optional[float],
+) -> TransactionDict:
+    """Assemble a parsed (still unclassified) transaction from its validated fields."""
+    # Intern repeated strings: dates come from at most 12*31 values and short
+    # descriptions ("SPEI ENVIADO ...", "RETIRO CAJERO") recur across rows
+    fecha_operacion = sys.intern(fecha_operacion)
+    fecha_liquidacion = sys.intern(fecha_liquidacion)
+    if len(description) < INTERN_DESCRIPTION_MAX_LEN:
+        description = sys.intern(description)
+    # Same cap for detail lines: short ones ("TRASPASO A ...", fixed reference
+    # labels) repeat, long unique references are not worth an intern table entry.
+    # movement_type needs nothing: it is always one of the interned literals.
+    if detail_line and len(detail_line) < INTERN_DESCRIPTION_MAX_LEN:
+        detail_line = sys.intern(detail_line)
+
+    return {
         'date': fecha_operacion,
         'date_liquidacion': fecha_liquidacion,
         'description': description,
@@ -274,56 +668,125 @@ def parse_transaction_line(line: str, detail_line: Optional[str] = None, debug:
         'saldo_liquidacion': saldo_liquidacion
     }
 
-    if debug:
-        print(f"Parsed successfully: {result}")
-    return result
 
+def parse_transaction_lines(
+    transaction_lines: List[Dict[str, Optional[str]]],
+    debug: bool = False
+) -> Tuple[List[TransactionDict], int]:
+    """
+    Parse a batch of raw transaction lines (output of extract_transaction_lines).
+
+    Args:
+        transaction_lines: Dicts with 'main_line' and optional 'detail_line'
+        debug: If True, print lines that fail to parse
+
+    Returns:
+        Tuple of (parsed transactions in input order, number of lines that failed to parse)
+    """
+    parsed_transactions: List[TransactionDict] = []
+    failed_count = 0
+
+    # Bind hot names locally once for the whole batch
+    parse_line = parse_transaction_line
+    append = parsed_transactions.append
 
-def extract_account_holder_key(pdf_path: str) -> Optional[str]:
+    for trans_data in transaction_lines:
+        main_line = trans_data['main_line']
+        parsed = parse_line(main_line, trans_data.get('detail_line'), debug)
+        if parsed:
+            append(parsed)
+        else:
+            failed_count += 1
+            if debug:
+                print(f"Failed to parse line: {main_line}")
+
+    return parsed_transactions, failed_count
+
+
+def iter_parsed_transactions(pdf_path: str, backend: str = "pdfplumber") -> Iterator[TransactionDict]:
+    """
+    Fused extract + parse: yield each successfully parsed (unclassified) transaction.
+
+    Lines that fail to parse are skipped. Callers that need a list use list(...).
+    """
+    for trans_data in iter_transaction_lines(pdf_path, backend):
+        parsed = parse_transaction_line(trans_data['main_line'], trans_data['detail_line'])
+        if parsed:
+            yield parsed
+
+
+def extract_account_holder_key(pdf_path: PdfSource) -> Optional[str]:
     """
     Extract account holder name key from PDF header for disambiguation.
 
     Scans first page for the account holder's full name (uppercase line).
     Returns a compact key like "DIEGO F" for matching in detail lines.
+    Results for a path are cached per file version (path + mtime).
 
     Args:
-        pdf_path: Path to the BBVA PDF statement.
+        pdf_path: Path to the BBVA PDF statement, or page texts from _load_pdf_text.
 
     Returns:
         Compact account holder key (first name + first initial of surname) or None.
     """
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if len(pdf.pages) == 0:
-                return None
-
-            # Check first page only
-            text = pdf.pages[0].extract_text()
-            if not text:
-                return None
-
-            lines = text.split('\n')
-            for line in lines[:20]:  # Only check first 20 lines
-                line_clean = line.strip()
-                # Look for uppercase name pattern (e.g., "DIEGO FERRA LOPEZ")
-                # Typically 2-4 uppercase words, at least 10 chars
-                if (len(line_clean) >= 10 and
-                    line_clean.isupper() and
-                    not any(x in line_clean for x in ['BBVA', 'CUENTA', 'PERIODO', 'SALDO', 'PAGINA']) and
-                    ' ' in line_clean):
-                    # Extract first name + first char of first surname
-                    parts = line_clean.split()
-                    if len(parts) >= 2:
-                        first_name = parts[0]
-                        surname_initial = parts[1][0] if len(parts[1]) > 0 else ''
-                        return f"{first_name} {surname_initial}"
+        if _is_pdf_path(pdf_path):
+            pdf_path = os.fspath(pdf_path)
+            return _cached_account_holder_key(pdf_path, os.stat(pdf_path).st_mtime_ns)
+        return _account_holder_key_from_pages(pdf_path)
     except Exception:
         pass
 
     return None
 
 
-def extract_statement_summary(pdf_path: str) -> SummaryDict:
+@lru_cache(maxsize=16)
+def _cached_account_holder_key(pdf_path: str, mtime_ns: int) -> Optional[str]:
+    """
+    Holder key for one file version; mtime_ns is part of the cache key.
+
+    Only page 1 is extracted (all the scan reads), and only the key is cached,
+    not the statement text.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        if len(pdf.pages) == 0:
+            return None
+        return _account_holder_key_from_text(_plumber_page_text(pdf.pages[0]))
+
+
+def _account_holder_key_from_pages(page_texts: PdfPageTexts) -> Optional[str]:
+    """Holder key from pre-loaded page texts (first page only)."""
+    if len(page_texts) == 0:
+        return None
+    return _account_holder_key_from_text(page_texts[0])
+
+
+def _account_holder_key_from_text(text: Optional[str]) -> Optional[str]:
+    """Scan the first 20 lines of the first page's text for the holder's uppercase name."""
+    if not text:
+        return None
+
+    # Only check first 20 lines (maxsplit avoids splitting the rest of the page)
+    lines = text.split('\n', 20)[:20]
+    for line in lines:
+        line_clean = line.strip()
+        # Look for uppercase name pattern (e.g., "DIEGO FERRA LOPEZ")
+        # Typically 2-4 uppercase words, at least 10 chars
+        if (len(line_clean) >= 10 and
+            line_clean.isupper() and
+            not HOLDER_EXCLUDE_RE.search(line_clean) and
+            ' ' in line_clean):
+            # Extract first name + first char of first surname
+            parts = line_clean.split()
+            if len(parts) >= 2:
+                first_name = parts[0]
+                surname_initial = parts[1][0] if len(parts[1]) > 0 else ''
+                return f"{first_name} {surname_initial}"
+
+    return None
+
+
+def extract_statement_summary(pdf_path: PdfSource, backend: str = "pdfplumber") -> SummaryDict:
     """
     Extract the financial summary section from a BBVA debit account statement PDF.
 
@@ -347,8 +810,14 @@ def extract_statement_summary(pdf_path: str) -> SummaryDict:
     reported totals and protects downstream logic from silent data corruption.
 
     Args:
-        pdf_path (str):
-            Absolute or relative path to the BBVA debit statement PDF file.
+        pdf_path (str | PdfPageTexts):
+            Absolute or relative path to the BBVA debit statement PDF file,
+            or its page texts as returned by _load_pdf_text.
+
+        backend (str):
+            Text extraction backend used when a path is given (see PDF_BACKENDS).
+            The summary is plain label/amount lines, so the text-only
+            "pypdfium" backend reads it without pdfplumber's layout analysis.
 
     Returns:
         SummaryDict:
@@ -378,55 +847,74 @@ def extract_statement_summary(pdf_path: str) -> SummaryDict:
     """
     summary: SummaryDict = {}
     inside_summary = False
+    summary_complete = False
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if not text:
+        # Paths are streamed page by page (not via the shared _load_pdf_text) so
+        # the early exit below also skips extracting the pages after the summary
+        if _is_pdf_path(pdf_path):
+            page_texts = _cached_page_texts(pdf_path, backend)
+        else:
+            page_texts = pdf_path
+
+        for text in page_texts:
+            if not text:
+                continue
+
+            # splitlines() also breaks on stray \r from non-pdfplumber backends
+            for line in text.splitlines():
+                line_clean = line.strip()
+
+                # One case-insensitive scan finds every marker on the line;
+                # most lines have none and are skipped without a lower() copy
+                markers = {m.lastgroup for m in SUMMARY_MARKER_RE.finditer(line_clean)}
+                if not markers:
                     continue
 
-                lines = text.split('\n')
-                for line in lines:
-                    line_clean = line.strip()
-                    line_lower = line_clean.lower()
+                if "start" in markers:
+                    inside_summary = True
+                    continue
 
-                    if "comportamiento" in line_lower:
-                        inside_summary = True
-                        continue
+                if inside_summary and "end" in markers:
+                    inside_summary = False
+                    # Section closed with every field read: the remaining
+                    # pages are transaction detail, stop scanning
+                    summary_complete = SUMMARY_KEYS.issubset(summary)
+                    if summary_complete:
+                        break
+                    continue
 
-                    if inside_summary and "saldo promedio mínimo mensual" in line_lower:
-                        inside_summary = False
-                        continue
+                if not inside_summary:
+                    continue
 
-                    if not inside_summary:
-                        continue
+                if "starting_balance" in markers:
+                    prev_balance = _extract_last_money(line_clean)
+                    if prev_balance is not None:
+                        summary["starting_balance"] = prev_balance
+                    continue
 
-                    if "saldo anterior" in line_lower:
-                        prev_balance = _extract_last_money(line_clean)
-                        if prev_balance is not None:
-                            summary["starting_balance"] = prev_balance
-                        continue
+                if "deposits" in markers:
+                    n_deposits, deposits_amount = _extract_count_and_last_money(line_clean)
+                    if n_deposits is not None and deposits_amount is not None:
+                        summary["n_deposits"] = n_deposits
+                        summary["deposits_amount"] = deposits_amount
+                    continue
 
-                    if "depósitos / abonos" in line_lower:
-                        n_deposits, deposits_amount = _extract_count_and_last_money(line_clean)
-                        if n_deposits is not None and deposits_amount is not None:
-                            summary["n_deposits"] = n_deposits
-                            summary["deposits_amount"] = deposits_amount
-                        continue
+                if "charges" in markers:
+                    n_charges, charges_amount = _extract_count_and_last_money(line_clean)
+                    if n_charges is not None and charges_amount is not None:
+                        summary["n_charges"] = n_charges
+                        summary["charges_amount"] = charges_amount
+                    continue
 
-                    if "retiros / cargos" in line_lower:
-                        n_charges, charges_amount = _extract_count_and_last_money(line_clean)
-                        if n_charges is not None and charges_amount is not None:
-                            summary["n_charges"] = n_charges
-                            summary["charges_amount"] = charges_amount
-                        continue
+                if "final_balance" in markers:
+                    final_balance = _extract_last_money(line_clean)
+                    if final_balance is not None:
+                        summary["final_balance"] = final_balance
+                    continue
 
-                    if "saldo final" in line_lower:
-                        final_balance = _extract_last_money(line_clean)
-                        if final_balance is not None:
-                            summary["final_balance"] = final_balance
-                        continue
+            if summary_complete:
+                break
 
     except FileNotFoundError:
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
@@ -460,6 +948,105 @@ def extract_statement_summary(pdf_path: str) -> SummaryDict:
     return summary
 
 
+# ========================================
+# CLASSIFICATION KEYWORDS
+# ========================================
+
+# keywords (expanded for better coverage)
+# Note: "PAGO CUENTA DE TERCERO" removed from CARGO - it's ambiguous
+ABONO_KEYWORDS = [
+    "SPEI RECIBIDO",
+    "DEPOSITO",
+    "DEPOSITO DE TERCERO",
+    "ABONO",
+    "REEMBOLSO",
+    "DEVOLUC",
+    "INTERESES",
+    "BECAS",
+    "BECA",
+    "PAGO BECAS"
+]
+
+CARGO_KEYWORDS = [
+    "SPEI ENVIADO",
+    "RETIRO CAJERO",
+    "RETIRO CAJERO AUTOMATICO",
+    "PAGO TARJETA DE CREDITO",
+    "COMISION",
+    "IVA",
+    "EFECTIVO SEGURO",
+    "ATT"
+]
+
+# Ambiguous keywords that need detail line context
+AMBIGUOUS_KEYWORDS = [
+    "PAGO CUENTA DE TERCERO"
+]
+
+# Description normalization patterns (see _normalize_for_classification)
+STUCK_RECIBIDO_RE = re.compile(r'(RECIBIDO)([A-Z]+)')
+STUCK_ENVIADO_RE = re.compile(r'(ENVIADO)([A-Z]+)')
+TRANSF_NORM_RE = re.compile(r'\b(TRANSFERENCIA|TRANSF)\b')
+TRASP_NORM_RE = re.compile(r'\b(TRASPASO|TRASP)\b')
+MULTISPACE_RE = re.compile(r'\s+')
+
+# "Transfer to" markers in a normalized detail line (see _is_transfer_to)
+TRANSFER_TO_PROBES = ("TRANSF A", "TRASP A")
+
+# Each list compiled into one alternation: a single regex scan answers
+# "does any keyword occur in the description" (same as any(kw in desc))
+ABONO_KEYWORDS_RE = re.compile("|".join(map(re.escape, ABONO_KEYWORDS)))
+CARGO_KEYWORDS_RE = re.compile("|".join(map(re.escape, CARGO_KEYWORDS)))
+
+
+def _normalize_for_classification(desc: str) -> str:
+    """Normalize description text for more robust keyword matching."""
+    # Convert to uppercase
+    norm = desc.upper()
+    # Fix stuck words: RECIBIDO/ENVIADO followed immediately by letters
+    norm = STUCK_RECIBIDO_RE.sub(r'\1 \2', norm)
+    norm = STUCK_ENVIADO_RE.sub(r'\1 \2', norm)
+    # Normalize transfer variations to standard form
+    norm = TRANSF_NORM_RE.sub('TRANSF', norm)
+    norm = TRASP_NORM_RE.sub('TRASP', norm)
+    # Collapse multiple spaces to single space
+    norm = MULTISPACE_RE.sub(' ', norm)
+    return norm.strip()
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a word character as the \\b regex boundary."""
+    return ch.isalnum() or ch == '_'
+
+
+def _is_transfer_to(detail_norm: str) -> bool:
+    """
+    True if a normalized detail line holds a standalone "TRANSF A" / "TRASP A".
+
+    Normalization already maps TRANSFERENCIA/TRASPASO to TRANSF/TRASP, uppercases
+    and collapses whitespace, so plain substring probes with word-boundary checks
+    replace the former \\b(TRANSF(?:ERENCIA)?|TRASP(?:ASO)?)\\s+A\\b regex search.
+    """
+    for probe in TRANSFER_TO_PROBES:
+        start = detail_norm.find(probe)
+        while start != -1:
+            end = start + len(probe)
+            if ((start == 0 or not _is_word_char(detail_norm[start - 1])) and
+                (end == len(detail_norm) or not _is_word_char(detail_norm[end]))):
+                return True
+            start = detail_norm.find(probe, start + 1)
+    return False
+
+
+def _keyword_movement_type(description_norm: str) -> Optional[str]:
+    """Return "ABONO" or "CARGO" by keyword match (ABONO keywords take precedence), else None."""
+    if ABONO_KEYWORDS_RE.search(description_norm):
+        return "ABONO"
+    if CARGO_KEYWORDS_RE.search(description_norm):
+        return "CARGO"
+    return None
+
+
 def determine_transaction_type(
     transactions: List[TransactionDict],
     summary: SummaryDict,
@@ -487,79 +1074,35 @@ def determine_transaction_type(
     # 1. initialize
     balance_for_logic = summary["starting_balance"]  # Tracker for balance-based classification
 
-    # Compile transfer detection patterns once for performance
-    TRANSFER_TO_PATTERN = re.compile(
-        r'\b(TRANSF(?:ERENCIA)?|TRASP(?:ASO)?)\s+A\b',
-        re.IGNORECASE
-    )
-
-    # keywords (expanded for better coverage)
-    # Note: "PAGO CUENTA DE TERCERO" removed from CARGO - it's ambiguous
-    ABONO_KEYWORDS = [
-        "SPEI RECIBIDO",
-        "DEPOSITO",
-        "DEPOSITO DE TERCERO",
-        "ABONO",
-        "REEMBOLSO",
-        "DEVOLUC",
-        "INTERESES",
-        "BECAS",
-        "BECA",
-        "PAGO BECAS"
-    ]
-
-    CARGO_KEYWORDS = [
-        "SPEI ENVIADO",
-        "RETIRO CAJERO",
-        "RETIRO CAJERO AUTOMATICO",
-        "PAGO TARJETA DE CREDITO",
-        "COMISION",
-        "IVA",
-        "EFECTIVO SEGURO",
-        "ATT"
-    ]
-
-    # Ambiguous keywords that need detail line context
-    AMBIGUOUS_KEYWORDS = [
-        "PAGO CUENTA DE TERCERO"
-    ]
-
-    # Helper function to normalize description for classification
-    def normalize_for_classification(desc: str) -> str:
-        """Normalize description text for more robust keyword matching."""
-        # Convert to uppercase
-        norm = desc.upper()
-        # Fix stuck words: RECIBIDO/ENVIADO followed immediately by letters
-        norm = re.sub(r'(RECIBIDO)([A-Z]+)', r'\1 \2', norm)
-        norm = re.sub(r'(ENVIADO)([A-Z]+)', r'\1 \2', norm)
-        # Normalize transfer variations to standard form
-        norm = re.sub(r'\b(TRANSFERENCIA|TRANSF)\b', 'TRANSF', norm)
-        norm = re.sub(r'\b(TRASPASO|TRASP)\b', 'TRASP', norm)
-        # Collapse multiple spaces to single space
-        norm = re.sub(r'\s+', ' ', norm)
-        return norm.strip()
-
     # Helper function to disambiguate using detail line
-    def disambiguate_with_detail(description: str, detail: Optional[str], holder_key: Optional[str]) -> Optional[str]:
+    def disambiguate_with_detail(
+        description: str,
+        detail: Optional[str],
+        holder_key: Optional[str],
+        desc_norm: Optional[str] = None
+    ) -> Optional[str]:
         """
         Disambiguate ambiguous transactions using detail line context.
 
+        desc_norm: already-normalized description, if the caller has it.
+
         Returns: "ABONO", "CARGO", or None if can't disambiguate.
         """
         if not detail or not holder_key:
             return None
 
-        desc_norm = normalize_for_classification(description)
-        detail_norm = normalize_for_classification(detail)
+        if desc_norm is None:
+            desc_norm = _normalize_for_classification(description)
+        detail_norm = _normalize_for_classification(detail)
 
         # Check if this is an ambiguous transfer
         is_ambiguous = any(kw in desc_norm for kw in AMBIGUOUS_KEYWORDS)
         if not is_ambiguous:
             return None
 
-        # Check if detail shows transfer TO the account holder using compiled regex
+        # Check if detail shows transfer TO the account holder
         # Pattern: "TRANSF A", "TRANSFERENCIA A", "TRASP A", "TRASPASO A"
-        if TRANSFER_TO_PATTERN.search(detail_norm):
+        if _is_transfer_to(detail_norm):
             if holder_key in detail_norm:
                 return "ABONO"  # Incoming transfer to account holder
             else:
@@ -567,6 +1110,14 @@ def determine_transaction_type(
 
         return None
 
+    # Per-call memo: raw description -> (normalized description, keyword movement type)
+    description_cache: Dict[str, Tuple[str, Optional[str]]] = {}
+
+    # Debug output (classification trace, second pass and the final report) is
+    # built in memory and written once at the end: one write per call instead
+    # of one per line on large statements
+    report = io.StringIO() if debug else None
+
     # 2. classify each transaction
     for transaction in transactions:
         # Use saldo_operacion if available (immediate balance), else saldo_liquidacion (delayed settlement)
@@ -581,8 +1132,14 @@ def determine_transaction_type(
         # Initialize review flag
         transaction["needs_review"] = False
 
-        # Normalize description ONCE for all checks
-        description_norm = normalize_for_classification(description)
+        # Normalize description ONCE for all checks (reused by disambiguation and keywords);
+        # repeated descriptions (e.g. "SPEI ENVIADO ...") reuse the memoized result
+        cached = description_cache.get(description)
+        if cached is None:
+            description_norm = _normalize_for_classification(description)
+            cached = (description_norm, _keyword_movement_type(description_norm))
+            description_cache[description] = cached
+        description_norm, description_keyword_type = cached
 
         # HARD OVERRIDES (MVP safety net for high-confidence keywords)
         # These bypass balance logic to avoid known classification bugs
@@ -593,7 +1150,7 @@ def determine_transaction_type(
             transaction["movement_type"] = "ABONO"
             transaction["amount"] = amount_abs
             if debug:
-                print("abono hard override (SPEI RECIBIDO)")
+                print("abono hard override (SPEI RECIBIDO)", file=report)
             if current_balance is not None:
                 balance_for_logic = current_balance
             else:
@@ -605,7 +1162,7 @@ def determine_transaction_type(
             transaction["movement_type"] = "CARGO"
             transaction["amount"] = -amount_abs
             if debug:
-                print("cargo hard override (SPEI ENVIADO)")
+                print("cargo hard override (SPEI ENVIADO)", file=report)
             if current_balance is not None:
                 balance_for_logic = current_balance
             else:
@@ -622,14 +1179,14 @@ def determine_transaction_type(
                 transaction["movement_type"] = "ABONO"
                 transaction["amount"] = amount_abs
                 if debug:
-                    print("abono case a")
+                    print("abono case a", file=report)
 
             elif current_balance < balance_for_logic:
                 # balance went down: expense
                 transaction["movement_type"] = "CARGO"
                 transaction["amount"] = -amount_abs
                 if debug:
-                    print("cargo case a")
+                    print("cargo case a", file=report)
 
             else:
                 # current balance == balance_for_logic (rare edge case)
@@ -643,56 +1200,44 @@ def determine_transaction_type(
                         transaction["movement_type"] = "ABONO"
                         transaction["amount"] = amount_abs
                         if debug:
-                            print("abono case a igual (saldo_operacion)")
+                            print("abono case a igual (saldo_operacion)", file=report)
                     else:  # saldo_op < balance_for_logic
                         transaction["movement_type"] = "CARGO"
                         transaction["amount"] = -amount_abs
                         if debug:
-                            print("cargo case a igual (saldo_operacion)")
+                            print("cargo case a igual (saldo_operacion)", file=report)
                 else:
                     # Can't use saldo_operacion - try disambiguation first, then fall back to keywords
-                    description_norm = normalize_for_classification(description)
-
                     # Check if this is an ambiguous transaction that can be disambiguated
                     is_ambiguous = any(kw in description_norm for kw in AMBIGUOUS_KEYWORDS)
                     detail = transaction.get("detail")
 
                     if is_ambiguous:
                         # Try disambiguation first for ambiguous keywords
-                        disambiguated = disambiguate_with_detail(description, detail, account_holder_key)
+                        disambiguated = disambiguate_with_detail(description, detail, account_holder_key, description_norm)
                         if disambiguated:
                             transaction["movement_type"] = disambiguated
                             transaction["amount"] = amount_abs if disambiguated == "ABONO" else -amount_abs
                             if debug:
-                                print(f"{disambiguated.lower()} case a igual (disambiguated)")
+                                print(f"{disambiguated.lower()} case a igual (disambiguated)", file=report)
                             if current_balance is not None:
                                 balance_for_logic = current_balance
                             continue
 
-                    is_abono = False
-                    for keyword in ABONO_KEYWORDS:
-                        if keyword in description_norm:
-                            is_abono = True
-                            break
+                    keyword_type = description_keyword_type
 
-                    if is_abono:
+                    if keyword_type == "ABONO":
                         transaction["movement_type"] = "ABONO"
                         transaction["amount"] = amount_abs
                         if debug:
-                            print("abono case a igual (keywords)")
+                            print("abono case a igual (keywords)", file=report)
                     else:
                         # Check CARGO keywords
-                        is_cargo = False
-                        for keyword in CARGO_KEYWORDS:
-                            if keyword in description_norm:
-                                is_cargo = True
-                                break
-
-                        if is_cargo:
+                        if keyword_type == "CARGO":
                             transaction["movement_type"] = "CARGO"
                             transaction["amount"] = -amount_abs
                             if debug:
-                                print("cargo case a igual (keywords)")
+                                print("cargo case a igual (keywords)", file=report)
                         else:
                             # ✅ UNKNOWN - This is INTENTIONAL and will be resolved manually in UI
                             # No keywords matched and balance is ambiguous (rare case)
@@ -701,7 +1246,7 @@ def determine_transaction_type(
                             transaction["needs_review"] = True
                             if debug:
                                 detail = transaction.get("detail")
-                                print(f"unknown case a igual (no keywords) - Amount: {amount_abs}, Detail: {detail if detail else 'N/A'}")
+                                print(f"unknown case a igual (no keywords) - Amount: {amount_abs}, Detail: {detail if detail else 'N/A'}", file=report)
 
             # Update balance_for_logic with current balance
             balance_for_logic = current_balance
@@ -711,42 +1256,29 @@ def determine_transaction_type(
         else:
             # Try disambiguation first for ambiguous transfers
             detail = transaction.get("detail")
-            disambiguated = disambiguate_with_detail(description, detail, account_holder_key)
+            disambiguated = disambiguate_with_detail(description, detail, account_holder_key, description_norm)
 
             if disambiguated:
                 transaction["movement_type"] = disambiguated
                 transaction["amount"] = amount_abs if disambiguated == "ABONO" else -amount_abs
                 if debug:
-                    print(f"{disambiguated.lower()} case b (disambiguated via detail)")
+                    print(f"{disambiguated.lower()} case b (disambiguated via detail)", file=report)
             else:
-                # normalize description for classification
-                description_norm = normalize_for_classification(description)
-
-                # check abono keywords first
-                is_abono = False
-                for keyword in ABONO_KEYWORDS:
-                    if keyword in description_norm:
-                        is_abono = True
-                        break
+                # check abono keywords first (description_norm computed once above)
+                keyword_type = description_keyword_type
 
-                if is_abono:
+                if keyword_type == "ABONO":
                     transaction["movement_type"] = "ABONO"
                     transaction["amount"] = amount_abs
                     if debug:
-                        print("abono case b")
+                        print("abono case b", file=report)
                 else:
                     # Check CARGO keywords
-                    is_cargo = False
-                    for keyword in CARGO_KEYWORDS:
-                        if keyword in description_norm:
-                            is_cargo = True
-                            break
-
-                    if is_cargo:
+                    if keyword_type == "CARGO":
                         transaction["movement_type"] = "CARGO"
                         transaction["amount"] = -amount_abs
                         if debug:
-                            print("cargo case b")
+                            print("cargo case b", file=report)
                     else:
                         # ✅ UNKNOWN - This is INTENTIONAL and will be resolved manually in UI
                         # No balance AND no keywords matched - expected for rare transaction types
@@ -754,7 +1286,7 @@ def determine_transaction_type(
                         transaction["amount"] = None
                         transaction["needs_review"] = True
                         if debug:
-                            print(f"unknown case b (no keywords) - Amount: {amount_abs}, Detail: {detail if detail else 'N/A'}")
+                            print(f"unknown case b (no keywords) - Amount: {amount_abs}, Detail: {detail if detail else 'N/A'}", file=report)
 
             # Case B: Manually update balance_for_logic based on classification
             # This prevents drift when Case B transactions occur between Case A anchors
@@ -783,9 +1315,9 @@ def determine_transaction_type(
         return None
 
     if debug:
-        print(f"\n{'='*70}")
-        print("SECOND PASS: RECONCILIATION-BASED UNKNOWN RESOLUTION")
-        print(f"{'='*70}")
+        print(f"\n{'='*70}", file=report)
+        print("SECOND PASS: RECONCILIATION-BASED UNKNOWN RESOLUTION", file=report)
+        print(f"{'='*70}", file=report)
 
     # Find anchors based on effective balance
     anchors = [i for i, t in enumerate(transactions) if get_anchor_balance(t) is not None]
@@ -816,7 +1348,7 @@ def determine_transaction_type(
 
             if debug and unknown_idxs:
                 unk_sum = round(sum(transactions[k]["amount_abs"] for k in unknown_idxs), 2)
-                print(f"DEBUG Segment {start_idx+1}-{end_idx+1}: diff={diff:+.2f}, unknowns={len(unknown_idxs)}, unknown_sum={unk_sum:.2f}")
+                print(f"DEBUG Segment {start_idx+1}-{end_idx+1}: diff={diff:+.2f}, unknowns={len(unknown_idxs)}, unknown_sum={unk_sum:.2f}", file=report)
 
             # Try full-sum match ONLY (MVP - no subset matching)
             if unknown_idxs and abs(diff) > TOL:
@@ -831,17 +1363,17 @@ def determine_transaction_type(
                         t["needs_review"] = False
                         resolved_count += 1
                     if debug:
-                        print(f"✓ Resolved ALL {len(unknown_idxs)} UNKNOWNs as {sign_type} (full-sum match)")
+                        print(f"✓ Resolved ALL {len(unknown_idxs)} UNKNOWNs as {sign_type} (full-sum match)", file=report)
                 else:
                     if debug:
-                        print(f"✗ No full-sum match. Leaving {len(unknown_idxs)} UNKNOWN(s) for manual review.")
+                        print(f"✗ No full-sum match. Leaving {len(unknown_idxs)} UNKNOWN(s) for manual review.", file=report)
 
             prev_anchor_idx = anchor_idx
             prev_anchor_balance = anchor_balance
 
         if debug:
-            print(f"\nResolved {resolved_count} UNKNOWN transaction(s) via reconciliation")
-            print(f"{'='*70}\n")
+            print(f"\nResolved {resolved_count} UNKNOWN transaction(s) via reconciliation", file=report)
+            print(f"{'='*70}\n", file=report)
 
     # 3. validation (skip UNKNOWN transactions)
 
@@ -876,35 +1408,35 @@ def determine_transaction_type(
 
     # Report classification results
     if debug:
-        print(f"\n{'='*70}")
-        print("CLASSIFICATION SUMMARY")
-        print(f"{'='*70}")
-        print(f"✅ Abonos classified: {count_abonos}")
-        print(f"✅ Cargos classified: {count_cargos}")
-        print(f"⚠️  Unknown (need review): {count_unknown}")
-        print(f"{'='*70}\n")
+        print(f"\n{'='*70}", file=report)
+        print("CLASSIFICATION SUMMARY", file=report)
+        print(f"{'='*70}", file=report)
+        print(f"✅ Abonos classified: {count_abonos}", file=report)
+        print(f"✅ Cargos classified: {count_cargos}", file=report)
+        print(f"⚠️  Unknown (need review): {count_unknown}", file=report)
+        print(f"{'='*70}\n", file=report)
 
         # validate amounts (only for classified transactions)
         if abs(total_abonos - expected_abonos) > 0.1:
-            print(f"WARNING: Abonos total mismatch: calculated {total_abonos:.2f}, expected {expected_abonos:.2f}")
+            print(f"WARNING: Abonos total mismatch: calculated {total_abonos:.2f}, expected {expected_abonos:.2f}", file=report)
 
         if abs(total_cargos - expected_cargos) > 0.1:
-            print(f"WARNING: Cargos total mismatch: calculated {total_cargos:.2f}, expected {expected_cargos:.2f}")
+            print(f"WARNING: Cargos total mismatch: calculated {total_cargos:.2f}, expected {expected_cargos:.2f}", file=report)
 
         # Print mathematically correct deltas and unknown info
-        print(f"INFO: Deposits delta (expected - calculated) = {deposits_delta:+,.2f}")
-        print(f"INFO: Charges delta (calculated - expected) = {charges_delta:+,.2f}")
-        print(f"INFO: Unknown transactions = {count_unknown} (total UNKNOWN amount = {unknown_amount_total:,.2f})")
+        print(f"INFO: Deposits delta (expected - calculated) = {deposits_delta:+,.2f}", file=report)
+        print(f"INFO: Charges delta (calculated - expected) = {charges_delta:+,.2f}", file=report)
+        print(f"INFO: Unknown transactions = {count_unknown} (total UNKNOWN amount = {unknown_amount_total:,.2f})", file=report)
 
         # Show UNKNOWN transaction descriptions for debugging
         if count_unknown > 0:
-            print(f"\n{'='*70}")
-            print(f"UNKNOWN TRANSACTION DESCRIPTIONS ({count_unknown} total)")
-            print(f"{'='*70}")
+            print(f"\n{'='*70}", file=report)
+            print(f"UNKNOWN TRANSACTION DESCRIPTIONS ({count_unknown} total)", file=report)
+            print(f"{'='*70}", file=report)
             for i, t in enumerate(transactions, 1):
                 if t.get('movement_type') == 'UNKNOWN':
-                    print(f"{i}. {t['date']} | {t['description']}")
-            print(f"{'='*70}\n")
+                    print(f"{i}. {t['date']} | {t['description']}", file=report)
+            print(f"{'='*70}\n", file=report)
 
         # Reconciliation audit - anchor-based balance validation
         def signed_amount(t: TransactionDict) -> Optional[float]:
@@ -921,17 +1453,20 @@ def determine_transaction_type(
             saldo_liq = t.get("saldo_liquidacion")
             return saldo_op if saldo_op is not None else saldo_liq
 
-        print(f"\n{'='*70}")
-        print("RECONCILIATION AUDIT (ANCHOR-BASED)")
-        print(f"{'='*70}")
+        print(f"\n{'='*70}", file=report)
+        print("RECONCILIATION AUDIT (ANCHOR-BASED)", file=report)
+        print(f"{'='*70}", file=report)
+
+        # Effective balance of every transaction, computed once for anchors and risk counts
+        balances = [get_effective_balance(t) for t in transactions]
 
         # Find anchors: indices where effective balance exists (saldo_operacion or saldo_liquidacion)
-        anchors = [i for i, t in enumerate(transactions) if get_effective_balance(t) is not None]
+        anchors = [i for i, balance in enumerate(balances) if balance is not None]
 
-        print(f"Anchors found: {len(anchors)}")
+        print(f"Anchors found: {len(anchors)}", file=report)
 
         if len(anchors) == 0:
-            print("No anchors available (no effective balance). Skipping audit.")
+            print("No anchors available (no effective balance). Skipping audit.", file=report)
         else:
             # Initial anchor balance is starting_balance, BEFORE first anchor we reconcile from starting_balance
             prev_anchor_idx = None
@@ -941,30 +1476,29 @@ def determine_transaction_type(
 
             # We'll treat each anchor as the end of a segment.
             for anchor_pos, anchor_idx in enumerate(anchors):
-                anchor_balance = float(get_effective_balance(transactions[anchor_idx]))
+                anchor_balance = float(balances[anchor_idx])
 
                 # Segment boundaries:
                 # from (prev_anchor_idx + 1) to anchor_idx inclusive
                 start_idx = 0 if prev_anchor_idx is None else prev_anchor_idx + 1
                 end_idx = anchor_idx
 
-                seg = transactions[start_idx:end_idx + 1]
-
                 # Compute deltas in this segment
                 computed_delta = 0.0
                 unknown_count = 0
                 no_balance_count = 0
                 suspicious = []
 
-                for j, t in enumerate(seg, start=start_idx):
-                    sa = signed_amount(t)
+                for j in range(start_idx, end_idx + 1):
+                    sa = signed_amount(transactions[j])
                     if sa is None:
                         unknown_count += 1
-                        suspicious.append(j)
+                        if unknown_count <= 10:  # only the first 10 are reported
+                            suspicious.append(j)
                         continue
                     computed_delta += sa
 
-                    if get_effective_balance(t) is None:
+                    if balances[j] is None:
                         no_balance_count += 1  # risk factor
 
                 expected_delta = anchor_balance - prev_anchor_balance
@@ -982,33 +1516,34 @@ def determine_transaction_type(
                         "diff": diff,
                         "unknown_count": unknown_count,
                         "no_balance_count": no_balance_count,
-                        "suspicious_indices": suspicious[:10],  # cap
+                        "suspicious_indices": suspicious,  # capped at 10 above
                     })
 
                 # Move anchor forward
                 prev_anchor_idx = anchor_idx
                 prev_anchor_balance = anchor_balance
 
-            print(f"Segments checked: {len(anchors)}")
-            print(f"Segments with mismatch: {len(segment_breaks)}")
+            print(f"Segments checked: {len(anchors)}", file=report)
+            print(f"Segments with mismatch: {len(segment_breaks)}", file=report)
 
             if segment_breaks:
-                print(f"\nTop {min(10, len(segment_breaks))} segment mismatches:")
-                print("-"*70)
-                for s in segment_breaks[:10]:
-                    print(f"Segment {s['segment_start']}-{s['segment_end']}")
-                    print(f"  Anchor: {s['prev_anchor_balance']:,.2f} -> {s['anchor_balance']:,.2f}")
-                    print(f"  Expected delta: {s['expected_delta']:+,.2f}")
-                    print(f"  Computed delta: {s['computed_delta']:+,.2f}")
-                    print(f"  Diff (expected - computed): {s['diff']:+,.2f}")
-                    print(f"  UNKNOWN in segment: {s['unknown_count']}, NO_BALANCE in segment: {s['no_balance_count']}")
+                print(f"\nTop {min(10, len(segment_breaks))} segment mismatches:", file=report)
+                print("-"*70, file=report)
+                for s in islice(segment_breaks, 10):
+                    print(f"Segment {s['segment_start']}-{s['segment_end']}", file=report)
+                    print(f"  Anchor: {s['prev_anchor_balance']:,.2f} -> {s['anchor_balance']:,.2f}", file=report)
+                    print(f"  Expected delta: {s['expected_delta']:+,.2f}", file=report)
+                    print(f"  Computed delta: {s['computed_delta']:+,.2f}", file=report)
+                    print(f"  Diff (expected - computed): {s['diff']:+,.2f}", file=report)
+                    print(f"  UNKNOWN in segment: {s['unknown_count']}, NO_BALANCE in segment: {s['no_balance_count']}", file=report)
                     if s["suspicious_indices"]:
                         # indices are 0-based; show 1-based in print
                         sus = [idx + 1 for idx in s["suspicious_indices"]]
-                        print(f"  Suspicious tx indices (first 10): {sus}")
-                    print()
+                        print(f"  Suspicious tx indices (first 10): {sus}", file=report)
+                    print(file=report)
 
-        print(f"{'='*70}\n")
+        print(f"{'='*70}\n", file=report)
+        sys.stdout.write(report.getvalue())
 
     return transactions
 
@@ -1042,10 +1577,23 @@ def parse_bbva_debit_statement(pdf_path: str, debug: bool = False) -> ParserResu
     """
     warnings: List[str] = []
 
+    # Open the PDF once; every step below works on the same page texts.
+    # Loaded without the lru_cache: statements are deleted after processing,
+    # so their text should not outlive this call.
+    try:
+        page_texts: PdfPageTexts = tuple(_cached_page_texts(pdf_path))
+    except Exception as e:
+        warnings.append(f"Failed to extract transaction lines: {type(e).__name__}")
+        return {
+            "transactions": [],
+            "warnings": warnings,
+            "summary": None
+        }
+
     # Step 0: Extract account holder key for disambiguation
     account_holder_key = None
     try:
-        account_holder_key = extract_account_holder_key(pdf_path)
+        account_holder_key = extract_account_holder_key(page_texts)
         if debug and account_holder_key:
             print(f"Account holder key: {account_holder_key}")
     except Exception:
@@ -1053,7 +1601,7 @@ def parse_bbva_debit_statement(pdf_path: str, debug: bool = False) -> ParserResu
 
     # Step 1: Extract raw transaction lines with detail context
     try:
-        transaction_lines = extract_transaction_lines(pdf_path)
+        transaction_lines = extract_transaction_lines(page_texts)
         if debug:
             print(f"\n{'='*70}")
             print(f"FOUND {len(transaction_lines)} RAW TRANSACTION LINES")
@@ -1067,18 +1615,7 @@ def parse_bbva_debit_statement(pdf_path: str, debug: bool = False) -> ParserResu
         }
 
     # Step 2: Parse each transaction line with detail context
-    parsed_transactions: List[TransactionDict] = []
-    failed_count = 0
-    for trans_data in transaction_lines:
-        main_line = trans_data['main_line']
-        detail_line = trans_data.get('detail_line')
-        parsed = parse_transaction_line(main_line, detail_line, debug=debug)
-        if parsed:
-            parsed_transactions.append(parsed)
-        else:
-            failed_count += 1
-            if debug:
-                print(f"Failed to parse line: {main_line}")
+    parsed_transactions, failed_count = parse_transaction_lines(transaction_lines, debug=debug)
 
     if failed_count > 0:
         warnings.append(f"Failed to parse {failed_count} transaction line(s)")
@@ -1091,7 +1628,7 @@ def parse_bbva_debit_statement(pdf_path: str, debug: bool = False) -> ParserResu
     # Step 3: Extract statement summary
     summary: Optional[SummaryDict] = None
     try:
-        summary = extract_statement_summary(pdf_path)
+        summary = extract_statement_summary(page_texts)
         if debug:
             print(f"Summary extracted successfully: {summary}")
     except ValueError as e:
@@ -1245,6 +1782,12 @@ if __name__ == "__main__":
     if "--debug" in sys.argv:
         debug = True
 
+    # Parse traces go through this module's logger; show them on stdout when debugging
+    # (module logger only, so pdfminer's own DEBUG chatter stays off)
+    if debug:
+        logger.addHandler(logging.StreamHandler(sys.stdout))
+        logger.setLevel(logging.DEBUG)
+
     result = parse_bbva_debit_statement(pdf_path, debug=debug)
 
     # Minimal CLI output always shown (verbose logs only under debug=True)
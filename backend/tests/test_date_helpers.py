@@ -0,0 +1,57 @@
+"""
+Tests for the BBVA 'DD/MMM' date helpers.
+"""
+
+from datetime import date
+
+import pytest
+
+from app.utils.date_helpers import make_bbva_date_parser, parse_bbva_date
+
+
+@pytest.mark.parametrize(
+    "statement_month, date_str, expected",
+    [
+        # Same month and earlier months stay in the statement year
+        (date(2025, 11, 1), "11/NOV", date(2025, 11, 11)),
+        (date(2025, 11, 1), "30/OCT", date(2025, 10, 30)),
+        # January statement with December rows: previous year
+        (date(2025, 1, 1), "28/DIC", date(2024, 12, 28)),
+        (date(2025, 1, 1), "02/ENE", date(2025, 1, 2)),
+        # December statement: nothing rolls over
+        (date(2025, 12, 1), "31/DIC", date(2025, 12, 31)),
+        # Input is normalized (spaces, lowercase)
+        (date(2025, 3, 1), " 5 / feb ", date(2025, 2, 5)),
+    ],
+)
+def test_make_bbva_date_parser_infers_year(statement_month, date_str, expected):
+    parse = make_bbva_date_parser(statement_month)
+
+    assert parse(date_str) == expected
+    assert parse_bbva_date(date_str, statement_month) == expected
+
+
+def test_make_bbva_date_parser_reuses_one_statement_month():
+    parse = make_bbva_date_parser(date(2025, 1, 1))
+
+    assert [parse(d) for d in ("30/DIC", "31/DIC", "01/ENE")] == [
+        date(2024, 12, 30),
+        date(2024, 12, 31),
+        date(2025, 1, 1),
+    ]
+
+
+@pytest.mark.parametrize("date_str", ["01/XYZ", "01/NOVIEMBRE", "01/"])
+def test_make_bbva_date_parser_rejects_unknown_month(date_str):
+    parse = make_bbva_date_parser(date(2025, 11, 1))
+
+    with pytest.raises(ValueError, match="Unknown month abbreviation"):
+        parse(date_str)
+
+
+@pytest.mark.parametrize("date_str", ["", "11NOV", "AB/NOV", "31/FEB"])
+def test_make_bbva_date_parser_rejects_invalid_dates(date_str):
+    parse = make_bbva_date_parser(date(2025, 11, 1))
+
+    with pytest.raises(ValueError):
+        parse(date_str)
@@ -0,0 +1,331 @@
+"""
+Tests for the BBVA debit parser: smoke tests on the default pdfplumber path
+plus line-level regression cases for parse_transaction_line.
+
+The fixture PDF is generated on the fly (plain Helvetica text lines), so the
+tests exercise real pdfplumber/pdfminer extraction without shipping a
+statement with personal data.
+"""
+
+import io
+import json
+import logging
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pdfplumber
+import pdfplumber.page
+import pytest
+
+from app.utils import pdf_parser
+from app.utils.pdf_parser import (
+    determine_transaction_type,
+    extract_account_holder_key,
+    extract_statement_summary,
+    extract_transaction_lines,
+    parse_bbva_debit_statement,
+    parse_transaction_line,
+)
+
+
+PAGE_1 = [
+    "BBVA MEXICO",
+    "DIEGO FERRA LOPEZ",
+    "Comportamiento",
+    "Saldo Anterior 1,000.00",
+    "Depósitos / Abonos (+) 1 500.00",
+    "Retiros / Cargos (-) 2 300.00",
+    "Saldo Final 1,200.00",
+    "Saldo Promedio Mínimo Mensual 1,100.00",
+    "Detalle de Movimientos Realizados",
+    "FECHA OPER LIQ DESCRIPCION",
+    "01/DIC 01/DIC SPEI RECIBIDO BANORTE 500.00 1,500.00 1,500.00",
+    "REF 12345",
+    "02/DIC 02/DIC OXXO COMPRA 100.00 1,400.00 1,400.00",
+]
+
+PAGE_2 = [
+    "03/DIC 03/DIC PAGO SERVICIO 200.00 1,200.00 1,200.00",
+    "Total de Movimientos",
+]
+
+
+def _pdf_string(text: str) -> bytes:
+    """Encode a PDF literal string (WinAnsi covers the accented labels)."""
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return b"(" + escaped.encode("cp1252") + b")"
+
+
+def _text_content(lines: List[str]) -> bytes:
+    """Content stream drawing one Helvetica (/F1) line per entry, top to bottom."""
+    return b"BT /F1 10 Tf 14 TL 40 800 Td " + b" ".join(
+        _pdf_string(line) + b" Tj T*" for line in lines
+    ) + b" ET"
+
+
+def _stream(attrs: bytes, content: bytes) -> bytes:
+    return b"<< " + attrs + b" /Length %d >>\nstream\n" % len(content) + content + b"\nendstream"
+
+
+def write_pdf(path: Path, pages: List[Tuple[bytes, bytes]], extra_objects: Dict[int, bytes]) -> Path:
+    """
+    Write a minimal PDF from (resources, content stream) pairs, one per page.
+
+    Objects 1-3 are the catalog, the page tree and the Helvetica font; pages
+    start at object 10, so ids 4-9 are free for extra_objects (XObjects).
+    """
+    page_ids = [10 + 2 * i for i in range(len(pages))]
+
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % i for i in page_ids)
+           + b"] /Count %d >>" % len(pages),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    }
+    objects.update(extra_objects)
+    for page_id, (resources, content) in zip(page_ids, pages):
+        objects[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << " + resources + b" >> /Contents %d 0 R >>" % (page_id + 1)
+        )
+        objects[page_id + 1] = _stream(b"", content)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n" % obj_id + objects[obj_id] + b"\nendobj\n"
+
+    xref_offset = len(out)
+    size = max(objects) + 1
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for obj_id in range(1, size):
+        if obj_id in offsets:
+            out += b"%010d 00000 n \n" % offsets[obj_id]
+        else:
+            out += b"0000000000 65535 f \n"
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset)
+
+    path.write_bytes(bytes(out))
+    return path
+
+
+def write_statement_pdf(path: Path, pages: List[List[str]]) -> Path:
+    """Write a minimal text-only PDF: one Helvetica line per entry, top to bottom."""
+    font_resources = b"/Font << /F1 3 0 R >>"
+    return write_pdf(path, [(font_resources, _text_content(lines)) for lines in pages], {})
+
+
+@pytest.fixture
+def statement_pdf(tmp_path: Path) -> Path:
+    return write_statement_pdf(tmp_path / "statement.pdf", [PAGE_1, PAGE_2])
+
+
+def _count_page_extractions(monkeypatch) -> List[int]:
+    """Record the page number of every pdfplumber extract_text() call."""
+    extracted = []
+    original_extract_text = pdfplumber.page.Page.extract_text
+
+    def counting_extract_text(page, *args, **kwargs):
+        extracted.append(page.page_number)
+        return original_extract_text(page, *args, **kwargs)
+
+    monkeypatch.setattr(pdfplumber.page.Page, "extract_text", counting_extract_text)
+    return extracted
+
+
+def test_parse_bbva_debit_statement_end_to_end(statement_pdf: Path):
+    result = parse_bbva_debit_statement(str(statement_pdf))
+
+    assert result["warnings"] == []
+    assert result["summary"] == {
+        "starting_balance": 1000.0,
+        "n_deposits": 1,
+        "deposits_amount": 500.0,
+        "n_charges": 2,
+        "charges_amount": 300.0,
+        "final_balance": 1200.0,
+    }
+    assert [(t["date"], t["movement_type"], t["amount"]) for t in result["transactions"]] == [
+        ("01/DIC", "ABONO", 500.0),
+        ("02/DIC", "CARGO", -100.0),
+        ("03/DIC", "CARGO", -200.0),
+    ]
+    assert result["transactions"][0]["detail"] == "REF 12345"
+
+
+def test_extractors_accept_path_objects(statement_pdf: Path):
+    assert extract_account_holder_key(statement_pdf) == "DIEGO F"
+    assert len(extract_transaction_lines(statement_pdf)) == 3
+    assert extract_statement_summary(statement_pdf)["final_balance"] == 1200.0
+
+
+def test_account_holder_key_reads_only_first_page(statement_pdf: Path, monkeypatch):
+    extracted = _count_page_extractions(monkeypatch)
+
+    assert extract_account_holder_key(str(statement_pdf)) == "DIEGO F"
+    assert extracted == [1]
+
+
+def test_parallel_extraction_matches_sequential(statement_pdf: Path, monkeypatch):
+    sequential = parse_bbva_debit_statement(str(statement_pdf))
+
+    # Force the opt-in worker path even for a two-page statement
+    monkeypatch.setenv(pdf_parser.PDF_EXTRACT_WORKERS_ENV, "2")
+    monkeypatch.setattr(pdf_parser, "PDF_PARALLEL_MIN_PAGES", 1)
+    parallel = parse_bbva_debit_statement(str(statement_pdf))
+
+    assert parallel == sequential
+    assert len(parallel["transactions"]) == 3
+
+
+def test_short_statement_with_workers_opens_pdf_once(statement_pdf: Path, monkeypatch):
+    opened = []
+    original_open = pdfplumber.open
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(path)
+        return original_open(path, *args, **kwargs)
+
+    # Workers requested, but two pages are below PDF_PARALLEL_MIN_PAGES
+    monkeypatch.setenv(pdf_parser.PDF_EXTRACT_WORKERS_ENV, "2")
+    monkeypatch.setattr(pdfplumber, "open", counting_open)
+
+    assert len(extract_transaction_lines(str(statement_pdf))) == 3
+    assert len(opened) == 1
+
+
+def test_page_text_check_skips_image_only_pages(tmp_path: Path):
+    # Page 1 only places an image (a scan); page 2 draws its text through a form XObject
+    image = _stream(
+        b"/Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray /BitsPerComponent 8",
+        b"\xff",
+    )
+    form = _stream(
+        b"/Type /XObject /Subtype /Form /BBox [0 0 612 842] /Resources << /Font << /F1 3 0 R >> >>",
+        _text_content(["TEXTO EN FORMULARIO"]),
+    )
+    pdf_path = write_pdf(
+        tmp_path / "xobjects.pdf",
+        [
+            (b"/XObject << /Im1 4 0 R >>", b"q 100 0 0 100 40 700 cm /Im1 Do Q"),
+            (b"/XObject << /Fm1 5 0 R >>", b"q /Fm1 Do Q"),
+        ],
+        {4: image, 5: form},
+    )
+
+    with pdfplumber.open(pdf_path) as pdf:
+        assert [pdf_parser._page_may_have_text(page) for page in pdf.pages] == [False, True]
+        assert pdf_parser._plumber_page_text(pdf.pages[0]) is None
+        assert pdf_parser._plumber_page_text(pdf.pages[1]) == "TEXTO EN FORMULARIO"
+
+
+# (line, (description, amount_abs, saldo_operacion, saldo_liquidacion) or None)
+TRANSACTION_LINE_CASES = [
+    ("01/DIC 01/DIC OXXO COMPRA 100.00 1,400.00 1,400.00", ("OXXO COMPRA", 100.0, 1400.0, 1400.0)),
+    ("01/DIC 01/DIC OXXO COMPRA 100.00", ("OXXO COMPRA", 100.0, None, None)),
+    # 2 amounts and 4+ amounts are rejected
+    ("01/DIC 01/DIC OXXO COMPRA 100.00 1,400.00", None),
+    ("01/DIC 01/DIC OXXO COMPRA 5.00 100.00 1,400.00 1,400.00", None),
+    ("01/DIC 01/DIC RETIRO 1.00 2.00 5.00 100.00 1,400.00 1,400.00", None),
+    # Irregular whitespace falls back to the general path with the same result
+    ("01/DIC 01/DIC OXXO  COMPRA 100.00 1,400.00 1,400.00", ("OXXO COMPRA", 100.0, 1400.0, 1400.0)),
+    ("01/DIC 01/DIC OXXO COMPRA  100.00 1,400.00 1,400.00", ("OXXO COMPRA", 100.0, 1400.0, 1400.0)),
+    ("01/DIC\t01/DIC OXXO\tCOMPRA 100.00 1,400.00 1,400.00", ("OXXO COMPRA", 100.0, 1400.0, 1400.0)),
+    ("01/DIC 01/DIC OXXO\u00a0COMPRA 100.00\u00a01,400.00 1,400.00", ("OXXO COMPRA", 100.0, 1400.0, 1400.0)),
+    # Numbers that are not amounts stay in the description
+    ("01/DIC 01/DIC PAGO TARJETA 1234 100.00 1,400.00 1,400.00", ("PAGO TARJETA 1234", 100.0, 1400.0, 1400.0)),
+    ("01/DIC 01/DIC PAGO 12 100.00", ("PAGO 12", 100.0, None, None)),
+]
+
+
+def _parsed_fields(transaction):
+    if transaction is None:
+        return None
+    return (
+        transaction["description"],
+        transaction["amount_abs"],
+        transaction["saldo_operacion"],
+        transaction["saldo_liquidacion"],
+    )
+
+
+@pytest.mark.parametrize("line, expected", TRANSACTION_LINE_CASES)
+def test_parse_transaction_line_fast_path_matches_general_path(line, expected, monkeypatch):
+    fast = parse_transaction_line(line)
+    fast_debug = parse_transaction_line(line, debug=True)
+
+    # A pattern that never matches forces every row through the split/rsplit path
+    monkeypatch.setattr(pdf_parser, "TX_PARSE_RE", re.compile(r"(?!)"))
+    general = parse_transaction_line(line)
+
+    assert _parsed_fields(fast) == expected
+    assert fast == fast_debug == general
+
+
+def test_parse_transaction_line_debug_uses_fast_path(caplog):
+    with caplog.at_level(logging.DEBUG, logger=pdf_parser.logger.name):
+        result = parse_transaction_line("01/DIC 01/DIC OXXO COMPRA 100.00 1,400.00 1,400.00", debug=True)
+
+    assert result is not None
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages[0] == "Parsing: 01/DIC 01/DIC OXXO COMPRA 100.00 1,400.00 1,400.00"
+    assert messages[-1].startswith("Parsed successfully: ")
+    # The general path would have logged its token split
+    assert not any(message.startswith("Tokens: ") for message in messages)
+
+
+def test_debug_classification_output_is_written_once(statement_pdf: Path, monkeypatch):
+    result = parse_bbva_debit_statement(str(statement_pdf))
+    transactions = [dict(t) for t in result["transactions"]]
+
+    writes = []
+
+    class RecordingStdout(io.StringIO):
+        def write(self, text):
+            writes.append(text)
+            return super().write(text)
+
+    monkeypatch.setattr(sys, "stdout", RecordingStdout())
+    determine_transaction_type(transactions, result["summary"], "DIEGO F", debug=True)
+
+    assert len(writes) == 1
+    # Per-transaction trace and second pass land in the same buffered write
+    assert "abono hard override (SPEI RECIBIDO)" in writes[0]
+    assert "SECOND PASS" in writes[0]
+    assert "CLASSIFICATION SUMMARY" in writes[0]
+
+
+
+def test_disk_cache_second_parse_extracts_nothing(statement_pdf: Path, tmp_path: Path, monkeypatch):
+    cache_dir = tmp_path / "text-cache"
+    monkeypatch.setenv(pdf_parser.PDF_TEXT_CACHE_ENV, str(cache_dir))
+    extracted = _count_page_extractions(monkeypatch)
+
+    first = parse_bbva_debit_statement(str(statement_pdf))
+    assert extracted == [1, 2]
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    extracted.clear()
+    second = parse_bbva_debit_statement(str(statement_pdf))
+    assert extracted == []
+    assert second == first
+
+
+@pytest.mark.parametrize("corrupt_entry", ['["truncated', '{"pages": []}', "[1, 2]"])
+def test_disk_cache_corrupt_entry_falls_back_to_extraction(
+    statement_pdf: Path, tmp_path: Path, monkeypatch, corrupt_entry: str
+):
+    cache_dir = tmp_path / "text-cache"
+    monkeypatch.setenv(pdf_parser.PDF_TEXT_CACHE_ENV, str(cache_dir))
+    expected = parse_bbva_debit_statement(str(statement_pdf))
+    (cache_file,) = cache_dir.glob("*.json")
+    cache_file.write_text(corrupt_entry, encoding="utf-8")
+
+    extracted = _count_page_extractions(monkeypatch)
+    assert parse_bbva_debit_statement(str(statement_pdf)) == expected
+    assert extracted == [1, 2]
+    # The entry is rewritten with the fresh extraction
+    assert json.loads(cache_file.read_text(encoding="utf-8"))[0].startswith("BBVA MEXICO")